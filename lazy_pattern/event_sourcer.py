@@ -1,15 +1,14 @@
 import os
 from abc import ABC, abstractmethod
-from collections import Counter
 from enum import Enum
-from functools import lru_cache
-from itertools import permutations
-from operator import itemgetter, or_
+from functools import lru_cache, reduce
+from operator import or_
 from typing import Callable, Generic, Iterable, TypeVar
 
 from lazy_pattern.error import LazyPatternError
 
-EVENT_SOURCER_CACHE_SIZE = os.environ.get("EVENT_SOURCER_CACHE_SIZE", 1024)
+EVENT_SOURCER_CACHE_SIZE = int(os.environ.get("EVENT_SOURCER_CACHE_SIZE", 1024))
+EVENT_SOURCER_SUBSET_TABLE_MAX = 16
 
 EventLabelT = TypeVar("EventLabelT", bound=Enum)
 SourceableT = TypeVar("SourceableT")
@@ -27,17 +26,42 @@ class ConstrainMode(Enum):
 
 
 class AbstractConstrainable(ABC, Generic[EventLabelT]):
+
+    ORDER_SENSITIVE = True
+    SELECTIVITY = 1
+
+    @abstractmethod
+    def constrain(
+        self,
+        event_labels: tuple[EventLabelT, ...],
+        labels_set: set[EventLabelT] | None = None,
+    ) -> None:
+        pass
+
     @abstractmethod
-    def constrain(self, event_labels: tuple[EventLabelT, ...]) -> None:
+    def feasible(self, event_labels: tuple[EventLabelT, ...]) -> bool:
         pass
 
 
 class SourcingConstraint(AbstractConstrainable):
+    def bind(self, label_bits: dict[EventLabelT, int], /) -> None:
 
-    pass
+        pass
+
+    def feasible_mask(self, prefix_mask: int, last_mask: int, /) -> bool:
+
+        return True
+
+    def satisfied_mask(self, prefix_mask: int, /) -> bool:
+
+        return True
 
 
 class MutuallyExclusiveConstraint(SourcingConstraint, Generic[EventLabelT]):
+
+    ORDER_SENSITIVE = False
+    SELECTIVITY = 0
+
     def __init__(
         self,
         events_constrained: Iterable[EventLabelT],
@@ -46,16 +70,46 @@ class MutuallyExclusiveConstraint(SourcingConstraint, Generic[EventLabelT]):
 
         self.__events_constrained = set(events_constrained)
 
-    def constrain(self, event_labels: tuple[EventLabelT, ...], /) -> None:
+    def bind(self, label_bits: dict[EventLabelT, int], /) -> None:
+
+        self._mask = reduce(
+            or_, (label_bits.get(event, 0) for event in self.__events_constrained), 0
+        )
+
+    def feasible_mask(self, prefix_mask: int, last_mask: int, /) -> bool:
+
+        return (prefix_mask & self._mask).bit_count() <= 1
+
+    def satisfied_mask(self, prefix_mask: int, /) -> bool:
+
+        return (prefix_mask & self._mask).bit_count() <= 1
 
-        catch_events = self.__events_constrained.intersection(set(event_labels))
+    def constrain(
+        self,
+        event_labels: tuple[EventLabelT, ...],
+        labels_set: set[EventLabelT] | None = None,
+        /,
+    ) -> None:
+
+        if labels_set is None:
+            labels_set = set(event_labels)
+
+        catch_events = self.__events_constrained.intersection(labels_set)
         if len(catch_events) > 1:
             raise EventSourcerConstraintError(
                 f"constrain error due to mutually exclusive events {catch_events}"
             )
 
+    def feasible(self, event_labels: tuple[EventLabelT, ...], /) -> bool:
+
+        return len(self.__events_constrained.intersection(event_labels)) <= 1
+
 
 class OccurrenceConstraint(SourcingConstraint, Generic[EventLabelT]):
+
+    ORDER_SENSITIVE = False
+    SELECTIVITY = 2
+
     def __init__(
         self,
         events_constrained: Iterable[EventLabelT],
@@ -70,22 +124,52 @@ class OccurrenceConstraint(SourcingConstraint, Generic[EventLabelT]):
         self.min_times = min_times
         self.max_times = max_times
 
-    def constrain(self, event_labels: tuple[EventLabelT, ...], /) -> None:
+    def bind(self, label_bits: dict[EventLabelT, int], /) -> None:
+
+        self._mask = reduce(
+            or_, (label_bits.get(event, 0) for event in self.events_constrained), 0
+        )
 
-        event_counter = Counter(event_labels)
-        event_occurred = self.events_constrained.intersection(set(event_labels))
+    def feasible_mask(self, prefix_mask: int, last_mask: int, /) -> bool:
 
-        try:
-            counts = itemgetter(*event_occurred)(event_counter)
-            occurrence = counts if isinstance(counts, int) else sum(counts)
-        except TypeError:
-            occurrence = 0
+        return (prefix_mask & self._mask).bit_count() <= self.max_times
+
+    def satisfied_mask(self, prefix_mask: int, /) -> bool:
+
+        return (
+            self.min_times <= (prefix_mask & self._mask).bit_count() <= self.max_times
+        )
+
+    def _distinct_fast(self, labels_set: set[EventLabelT], /) -> int:
+
+        return len(self.events_constrained & labels_set)
+
+    def constrain(
+        self,
+        event_labels: tuple[EventLabelT, ...],
+        labels_set: set[EventLabelT] | None = None,
+        /,
+    ) -> None:
+
+        if labels_set is not None and len(labels_set) == len(event_labels):
+            occurrence = self._distinct_fast(labels_set)
+        else:
+            occurrence = sum(
+                1 for event in event_labels if event in self.events_constrained
+            )
 
         if not (self.min_times <= occurrence <= self.max_times):
             raise EventSourcerConstraintError(
                 f"constrain error due to occurrence times {occurrence}"
             )
 
+    def feasible(self, event_labels: tuple[EventLabelT, ...], /) -> bool:
+
+        occurrence = sum(
+            1 for event in event_labels if event in self.events_constrained
+        )
+        return occurrence <= self.max_times
+
 
 class DependencyConstraint(SourcingConstraint, Generic[EventLabelT]):
     def __init__(
@@ -105,17 +189,54 @@ class DependencyConstraint(SourcingConstraint, Generic[EventLabelT]):
                 f"invalid dependency with intersection {intersection}"
             )
 
-    def constrain(self, event_labels: tuple[EventLabelT, ...], /) -> None:
+    def bind(self, label_bits: dict[EventLabelT, int], /) -> None:
+
+        self._constrained_mask = reduce(
+            or_, (label_bits.get(event, 0) for event in self.events_constrained), 0
+        )
+        self._constraints_mask = reduce(
+            or_, (label_bits.get(event, 0) for event in self.events_constraints), 0
+        )
+
+    def feasible_mask(self, prefix_mask: int, last_mask: int, /) -> bool:
+
+        return not (
+            last_mask & self._constrained_mask
+            and (prefix_mask ^ last_mask) & self._constraints_mask
+        )
+
+    def constrain(
+        self,
+        event_labels: tuple[EventLabelT, ...],
+        labels_set: set[EventLabelT] | None = None,
+        /,
+    ) -> None:
+
+        events_constrained = self.events_constrained
+        events_constraints = self.events_constraints
 
         constraints_found = None
         for event in event_labels:
-            if event in self.events_constrained and constraints_found:
+            if event in events_constrained and constraints_found:
                 raise EventSourcerConstraintError(
                     f"constrain error due to invalid dependency {constraints_found} -> {event}"
                 )
-            if event in self.events_constraints:
+            if event in events_constraints:
                 constraints_found = event
 
+    def feasible(self, event_labels: tuple[EventLabelT, ...], /) -> bool:
+
+        events_constrained = self.events_constrained
+        events_constraints = self.events_constraints
+
+        constraints_found = False
+        for event in event_labels:
+            if event in events_constrained and constraints_found:
+                return False
+            if event in events_constraints:
+                constraints_found = True
+        return True
+
 
 class EventSourcer(Generic[EventLabelT, SourceableT]):
     def __init__(
@@ -127,9 +248,79 @@ class EventSourcer(Generic[EventLabelT, SourceableT]):
     ) -> None:
 
         self.events = events
-        self.constraints = constraints
+        self.constraints = tuple(
+            sorted(constraints, key=lambda constraint: constraint.SELECTIVITY)
+        )
         self.func_source = func_source
 
+        self._source = lru_cache(maxsize=EVENT_SOURCER_CACHE_SIZE)(self._source_impl)
+
+        self._labels = tuple(events)
+        self._values = tuple(events.values())
+        self._label_index = {label: index for index, label in enumerate(events)}
+        self._label_bit = {label: 1 << index for index, label in enumerate(events)}
+
+        self._compiled: dict[tuple[EventLabelT, ...], Callable[..., SourceableT]] = {}
+
+        self._mask_constraints = tuple(
+            constraint
+            for constraint in self.constraints
+            if isinstance(constraint, SourcingConstraint)
+        )
+        self._tuple_constraints = tuple(
+            constraint
+            for constraint in self.constraints
+            if not isinstance(constraint, SourcingConstraint)
+        )
+        for constraint in self._mask_constraints:
+            constraint.bind(self._label_bit)
+
+        self._symmetric_constraints = tuple(
+            constraint
+            for constraint in self._mask_constraints
+            if not constraint.ORDER_SENSITIVE
+        )
+        self._ordered_constraints = tuple(
+            constraint
+            for constraint in self._mask_constraints
+            if constraint.ORDER_SENSITIVE
+        )
+        self._sym_ok_cache: dict[int, bool] = {}
+        self._sym_valid_cache: dict[int, bool] = {}
+
+        min_len, claimed = 0, set()
+        max_len, covered = 0, set()
+        for constraint in self.constraints:
+            if not isinstance(constraint, OccurrenceConstraint):
+                continue
+            constrained = constraint.events_constrained & set(events)
+            if constraint.min_times and not (constrained & claimed):
+                min_len += constraint.min_times
+                claimed |= constrained
+            max_len += min(constraint.max_times, len(constrained))
+            covered |= constrained
+        self._min_len = min_len
+        self._max_len = min(len(events), max_len + len(events) - len(covered))
+
+        self._subset_feasible: bytearray | None = None
+        self._subset_valid: bytearray | None = None
+        if (
+            self._symmetric_constraints
+            and len(events) <= EVENT_SOURCER_SUBSET_TABLE_MAX
+        ):
+            space = 1 << len(events)
+            self._subset_feasible = bytearray(space)
+            self._subset_valid = bytearray(space)
+            for mask in range(space):
+                self._subset_feasible[mask] = all(
+                    constraint.feasible_mask(mask, 0)
+                    for constraint in self._symmetric_constraints
+                )
+                self._subset_valid[mask] = all(
+                    constraint.satisfied_mask(mask)
+                    for constraint in self._symmetric_constraints
+                )
+
     def __getitem__(self, key: EventLabelT) -> SourceableT:
 
         return self.events[key]
@@ -145,27 +336,125 @@ class EventSourcer(Generic[EventLabelT, SourceableT]):
 
     def exhaustive(self) -> Iterable[tuple[tuple[EventLabelT, ...], SourceableT]]:
 
-        for length in range(len(self.events) + 1):
-            for candidate in permutations(self.events, length):
-                try:
-                    self.validate(candidate)
-                    yield candidate, self.source(candidate)
-                except EventSourcerConstraintError:
-                    continue
+        yield from self._dfs((), 0, None, list(range(len(self._labels))), 0)
+
+    def _dfs(
+        self,
+        prefix: tuple[int, ...],
+        prefix_mask: int,
+        prefix_value: SourceableT | None,
+        pool: list[int],
+        depth: int,
+        /,
+    ) -> Iterable[tuple[tuple[EventLabelT, ...], SourceableT]]:
+
+        subset_feasible = self._subset_feasible
+        subset_valid = self._subset_valid
+        candidate_length = depth + 1
+
+        for index in range(depth, len(pool)):
+
+            event_index = pool[index]
+            event_mask = 1 << event_index
+            candidate_mask = prefix_mask | event_mask
+
+            if subset_feasible is not None:
+                feasible = subset_feasible[candidate_mask]
+            else:
+                feasible = self._sym_ok_cache.get(candidate_mask)
+                if feasible is None:
+                    feasible = all(
+                        constraint.feasible_mask(candidate_mask, event_mask)
+                        for constraint in self._symmetric_constraints
+                    )
+                    self._sym_ok_cache[candidate_mask] = feasible
+            if not feasible:
+                continue
+
+            if not all(
+                constraint.feasible_mask(candidate_mask, event_mask)
+                for constraint in self._ordered_constraints
+            ):
+                continue
+
+            candidate = (*prefix, event_index)
+            if self._tuple_constraints and not all(
+                constraint.feasible(tuple(self._labels[picked] for picked in candidate))
+                for constraint in self._tuple_constraints
+            ):
+                continue
+
+            candidate_value = (
+                self._values[event_index]
+                if not prefix
+                else self.func_source(prefix_value, self._values[event_index])
+            )
+
+            if subset_valid is not None:
+                valid = subset_valid[candidate_mask]
+            else:
+                valid = self._sym_valid_cache.get(candidate_mask)
+                if valid is None:
+                    valid = all(
+                        constraint.satisfied_mask(candidate_mask)
+                        for constraint in self._symmetric_constraints
+                    )
+                    self._sym_valid_cache[candidate_mask] = valid
+            if valid and candidate_length >= self._min_len:
+                yield (
+                    tuple(self._labels[picked] for picked in candidate),
+                    candidate_value,
+                )
+
+            if candidate_length < self._max_len:
+                pool[depth], pool[index] = pool[index], pool[depth]
+                yield from self._dfs(
+                    candidate, candidate_mask, candidate_value, pool, depth + 1
+                )
+                pool[depth], pool[index] = pool[index], pool[depth]
 
     def validate(self, event_labels: tuple[EventLabelT, ...]) -> None:
 
+        labels_set = set(event_labels)
         for constraint in self.constraints:
-            constraint.constrain(event_labels)
+            constraint.constrain(event_labels, labels_set)
+
+    def compile_order(self, event_labels: tuple[EventLabelT, ...], /) -> None:
+
+        if not event_labels:
+
+            raise EventSourcerConstraintError(
+                "at least one event label should be provided"
+            )
+
+        self.validate(event_labels)
+
+        indexes = [self._label_index[label] for label in event_labels]
+        lines = [
+            "def compiled(values, func_source, /):",
+            f"    value = values[{indexes[0]}]",
+            *(
+                f"    value = func_source(value, values[{index}])"
+                for index in indexes[1:]
+            ),
+            "    return value",
+        ]
+
+        namespace: dict = {}
+        exec("\n".join(lines), namespace)
+        self._compiled[tuple(event_labels)] = namespace["compiled"]
 
     def source(self, event_labels: tuple[EventLabelT, ...]) -> SourceableT:
 
         self.validate(event_labels)
 
+        compiled = self._compiled.get(tuple(event_labels))
+        if compiled is not None:
+            return compiled(self._values, self.func_source)
+
         return self._source(tuple(event_labels))
 
-    @lru_cache(maxsize=EVENT_SOURCER_CACHE_SIZE)
-    def _source(self, event_labels: tuple[EventLabelT, ...]) -> SourceableT:
+    def _source_impl(self, event_labels: tuple[EventLabelT, ...]) -> SourceableT:
 
         if not event_labels:
 
@@ -173,8 +462,8 @@ class EventSourcer(Generic[EventLabelT, SourceableT]):
                 "at least one event label should be provided"
             )
 
-        if len(event_labels) == 1:
-            return self.events[event_labels[0]]
+        return self._source_direct(event_labels)
+
+    def _source_direct(self, event_labels: tuple[EventLabelT, ...], /) -> SourceableT:
 
-        previous = tuple(list(event_labels)[:-1])
-        return self.func_source(self._source(previous), self.events[event_labels[-1]])
+        return reduce(self.func_source, (self.events[label] for label in event_labels))
@@ -4,8 +4,11 @@ from asyncio import Lock
 from collections import deque
 from contextlib import asynccontextmanager
 from enum import Enum
+from fractions import Fraction
 from functools import wraps
+from itertools import chain
 from math import ceil, floor
+from types import SimpleNamespace
 from typing import Any, Callable, Generic, Iterable, TypeVar
 
 from pydantic import BaseModel, Field, confloat, conint
@@ -65,8 +68,17 @@ class ObjectPool(Generic[PoolMemberT]):
         self.idle = deque()
         self.busy = deque()
         self.config = config
+        self._cfg = SimpleNamespace(**config.dict())
+
+        self._busy_ids: set[int] = set()
+
+        util_ratio = Fraction(config.utilization).limit_denominator(100)
+        self._util_num = util_ratio.numerator
+        self._util_den = util_ratio.denominator
 
         self.is_cooling = False
+        self._cool_down_cleared = asyncio.Event()
+        self._cool_down_cleared.set()
 
         if config.policy == ScalingPolicy.FIXED:
             asyncio.create_task(self.prewarm())
@@ -76,18 +88,18 @@ class ObjectPool(Generic[PoolMemberT]):
 
     def __iter__(self) -> int:
 
-        for member in self.idle + self.busy:
+        for member in chain(self.idle, self.busy):
             yield member
 
     async def __aiter__(self) -> Iterable[PoolMemberT]:
 
         async with self.lock:
-            for member in self.idle + self.busy:
+            for member in chain(self.idle, self.busy):
                 yield member
 
     @property
     def size(self) -> int:
-        return len(self.idle + self.busy)
+        return len(self.idle) + len(self.busy)
 
     @property
     def utilization(self) -> float:
@@ -119,53 +131,47 @@ class ObjectPool(Generic[PoolMemberT]):
             return 0.0
         return round(usage / total, 2)
 
-    @async_lock
     async def prewarm(self) -> None:
 
-        await self.scale(self.config.desired)
+        await self.scale(self._cfg.desired)
 
     async def cool_down(self) -> None:
 
-        await asyncio.sleep(self.config.cool_down)
+        await asyncio.sleep(self._cfg.cool_down)
         self.is_cooling = False
+        self._cool_down_cleared.set()
 
     @async_lock
     async def plan(self, delta: int, /) -> int:
 
-        if self.config.policy == ScalingPolicy.FIXED:
+        if self._cfg.policy == ScalingPolicy.FIXED:
             return 0
 
-        expected_usage, planned_scale = len(self.busy) + delta, 0
+        size = self.size
+        expected_usage = len(self.busy) + delta
 
-        while (
-            self.calculate_utilization(expected_usage, self.size + planned_scale)
-            >= self.config.utilization
-        ):
-            planned_scale += 1
+        if expected_usage <= 0 or not size:
+            needed_total = 0
 
-        while (
-            self.size + planned_scale > 0
-            and self.calculate_utilization(
-                expected_usage, self.size + planned_scale - 1
-            )
-            < self.config.utilization
-        ):
-            planned_scale -= 1
+        else:
+            needed_total = expected_usage * self._util_den // self._util_num + 1
+
+        planned_scale = needed_total - size
 
         if planned_scale > 0:
             return (
                 planned_scale
-                if self.config.policy == ScalingPolicy.UNLIMITED
+                if self._cfg.policy == ScalingPolicy.UNLIMITED
                 else min(
                     planned_scale,
-                    self.config.max_size - self.size,
-                    ceil(self.size * self.config.scale_cap),
+                    self._cfg.max_size - size,
+                    ceil(size * self._cfg.scale_cap),
                 )
             )
         return max(
             planned_scale,
-            self.config.min_size - self.size,
-            -floor(self.size * self.config.scale_cap),
+            self._cfg.min_size - size,
+            -floor(size * self._cfg.scale_cap),
         )
 
     async def scale(self, size: int, /) -> None:
@@ -173,19 +179,25 @@ class ObjectPool(Generic[PoolMemberT]):
         if self.is_cooling or not size:
             return
 
-        if size < 0 and self.config.cool_down:
-            self.is_cooling = True
-            asyncio.create_task(self.cool_down())
+        if size < 0:
 
-        for _ in range(abs(size)):
+            if self._cfg.cool_down:
+                self.is_cooling = True
+                self._cool_down_cleared.clear()
+                asyncio.create_task(self.cool_down())
 
-            if size < 0:
-                self.idle.popleft()
+            async with self.lock:
+                for _ in range(-size):
+                    self.idle.popleft()
+            return
+
+        produced = [self._cfg.func_produce() for _ in range(size)]
 
-            else:
-                produced = self.config.func_produce()
-                produced.clean_up()
-                self.idle.append(produced)
+        for member in produced:
+            member.clean_up()
+
+        async with self.lock:
+            self.idle.extend(produced)
 
     @asynccontextmanager
     async def lease(self):
@@ -199,34 +211,36 @@ class ObjectPool(Generic[PoolMemberT]):
     @regulate(1)
     async def fetch(self):
 
-        retry_count, retry_interval = (0, self.config.retry_interval)
-        while retry_count < self.config.retry_times:
+        retry_count, retry_interval = (0, self._cfg.retry_interval)
+        while retry_count < self._cfg.retry_times:
 
             async with self.lock:
                 if self.idle:
                     pick = self.idle.popleft()
                     self.busy.append(pick)
+                    self._busy_ids.add(id(pick))
                     return pick
 
-            if retry_count < self.config.retry_times - 1:
+            if retry_count < self._cfg.retry_times - 1:
                 await asyncio.sleep(retry_interval)
 
             retry_count += 1
-            retry_interval *= self.config.retry_exp
+            retry_interval *= self._cfg.retry_exp
 
         raise ObjectPoolOverloadError
 
     @regulate(-1)
     async def remand(self, pool_member: PoolMemberT, /):
 
-        if pool_member not in self.busy:
+        if id(pool_member) not in self._busy_ids:
             raise ObjectPoolOperationError
 
         async with self.lock:
             pool_member.clean_up()
+            self._busy_ids.remove(id(pool_member))
             self.busy.remove(pool_member)
             self.idle.append(pool_member)
 
     async def project(self, func_project: Callable[[PoolMemberT], Any], /):
 
-        return list(map(func_project, self.idle + self.busy))
+        return list(map(func_project, chain(self.idle, self.busy)))
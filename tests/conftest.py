@@ -0,0 +1,22 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    try:
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        yield loop
+    finally:
+        loop.close()
+
+
+def pytest_addoption(parser):
+
+    parser.addoption(
+        "--all-combinations",
+        action="store_true",
+        default=False,
+        help="parametrize constraint tests over every label combination",
+    )
@@ -1,8 +1,9 @@
 from enum import Enum
 from functools import reduce
-from itertools import combinations
-from operator import add, or_
-from random import choice, randint, shuffle
+from itertools import chain, combinations
+from operator import or_
+from random import Random
+from types import MappingProxyType
 from typing import Dict
 
 import pytest
@@ -37,40 +38,124 @@ class OrderLabel(Enum):
     POPULAR = "popular"
 
 
-class TestSourcingConstraint:
+_EventSourcerDict = EventSourcer[EventLabel, Dict]
+
+SIZE_EVENTS = {EventLabel.SHORT, EventLabel.TALL, EventLabel.GRANDE}
+NON_SIZE_EVENTS = set(EventLabel) - SIZE_EVENTS
+
+SIZE_EVENTS_ORDERED = tuple(sorted(SIZE_EVENTS, key=lambda event: event.name))
+NON_SIZE_EVENTS_ORDERED = tuple(sorted(NON_SIZE_EVENTS, key=lambda event: event.name))
+
+COMBINATION_SAMPLE_SEED = 0xC0FFEE
+COMBINATION_SAMPLE_SIZE = 10
+
+COMBINATIONS = {length: tuple(combinations(EventLabel, length)) for length in range(4)}
+
+COMBINATION_LENGTHS = {
+    "test_mutually_exclusive": (0, 1),
+    "test_mutually_exclusive_invalid": (2,),
+    "test_occurrence": (1, 2),
+    "test_occurrence_invalid": (0, 3),
+}
+
+
+def pytest_generate_tests(metafunc):
+
+    lengths = COMBINATION_LENGTHS.get(metafunc.function.__name__)
+    if lengths is None or "event_labels" not in metafunc.fixturenames:
+        return
+
+    pool = list(chain.from_iterable(COMBINATIONS[length] for length in lengths))
+    if not metafunc.config.getoption("--all-combinations"):
+        pool = Random(COMBINATION_SAMPLE_SEED).sample(
+            pool, min(len(pool), COMBINATION_SAMPLE_SIZE)
+        )
+    metafunc.parametrize("event_labels", pool)
+
+
+EVENTS = MappingProxyType(
+    {
+        EventLabel.MORE_ICE: {"ice": "more ice"},
+        EventLabel.LESS_ICE: {"ice": "less ice"},
+        EventLabel.ICE_FREE: {"ice": "ice-free"},
+        EventLabel.FULL_SUGAR: {"sugar": "full sugar"},
+        EventLabel.HALF_SUGAR: {"sugar": "half sugar"},
+        EventLabel.SUGAR_FREE: {"sugar": "sugar-free"},
+        EventLabel.SHORT: {"size": "short"},
+        EventLabel.TALL: {"size": "tall"},
+        EventLabel.GRANDE: {"size": "grande"},
+    }
+)
+
+ORDERS = MappingProxyType(
+    {
+        OrderLabel.RECOMMEND: (
+            EventLabel.LESS_ICE,
+            EventLabel.SUGAR_FREE,
+            EventLabel.TALL,
+        ),
+        OrderLabel.POPULAR: (
+            EventLabel.ICE_FREE,
+            EventLabel.HALF_SUGAR,
+            EventLabel.TALL,
+        ),
+    }
+)
+
+RESULTS = MappingProxyType(
+    {
+        OrderLabel.RECOMMEND: {
+            "ice": "less ice",
+            "sugar": "sugar-free",
+            "size": "tall",
+        },
+        OrderLabel.POPULAR: {
+            "ice": "ice-free",
+            "sugar": "half sugar",
+            "size": "tall",
+        },
+    }
+)
+
+SUGAR_EVENTS = (EventLabel.FULL_SUGAR, EventLabel.HALF_SUGAR, EventLabel.SUGAR_FREE)
+ICE_EVENTS = (EventLabel.MORE_ICE, EventLabel.LESS_ICE, EventLabel.ICE_FREE)
+
+CONSTRAINTS = (
+    OccurrenceConstraint[EventLabel](SIZE_EVENTS),
+    OccurrenceConstraint[EventLabel](SUGAR_EVENTS, min_times=1),
+    OccurrenceConstraint[EventLabel](ICE_EVENTS, min_times=1),
+    MutuallyExclusiveConstraint[EventLabel](SIZE_EVENTS),
+    MutuallyExclusiveConstraint[EventLabel](SUGAR_EVENTS),
+    MutuallyExclusiveConstraint[EventLabel](ICE_EVENTS),
+    DependencyConstraint[EventLabel](SIZE_EVENTS, SUGAR_EVENTS),
+    DependencyConstraint[EventLabel](SUGAR_EVENTS, ICE_EVENTS),
+)
 
-    SIZE_EVENTS = {EventLabel.SHORT, EventLabel.TALL, EventLabel.GRANDE}
-    NON_SIZE_EVENTS = set(EventLabel) - SIZE_EVENTS
 
-    @pytest.fixture(scope="class", autouse=True)
+class TestSourcingConstraint:
+    @pytest.fixture(scope="module", autouse=True)
     def fixture_mutually_exclusive_constraint(self):
 
         yield MutuallyExclusiveConstraint(EventLabel)
 
-    @pytest.fixture(scope="class", autouse=True)
+    @pytest.fixture(scope="module", autouse=True)
     def fixture_occurrence_constraint(self):
 
         yield OccurrenceConstraint(EventLabel, min_times=1, max_times=2)
 
-    @pytest.fixture(scope="class", autouse=True)
+    @pytest.fixture(scope="module", autouse=True)
     def fixture_dependency_constraint(self):
 
-        yield DependencyConstraint(self.SIZE_EVENTS, self.NON_SIZE_EVENTS)
+        yield DependencyConstraint(SIZE_EVENTS, NON_SIZE_EVENTS)
 
-    @pytest.mark.parametrize(
-        "event_labels",
-        reduce(add, [list(combinations(EventLabel, x)) for x in range(2)]),
-    )
+    @pytest.mark.slow
     def test_mutually_exclusive(
         self, event_labels, fixture_mutually_exclusive_constraint
     ):
 
         fixture_mutually_exclusive_constraint.constrain(event_labels)
 
-    @pytest.mark.parametrize(
-        "event_labels",
-        reduce(add, [list(combinations(EventLabel, x)) for x in range(2, 3)]),
-    )
+    @pytest.mark.slow
     def test_mutually_exclusive_invalid(
         self, event_labels, fixture_mutually_exclusive_constraint
     ):
@@ -78,18 +163,12 @@ class TestSourcingConstraint:
         with pytest.raises(EventSourcerConstraintError):
             fixture_mutually_exclusive_constraint.constrain(event_labels)
 
-    @pytest.mark.parametrize(
-        "event_labels",
-        reduce(add, [list(combinations(EventLabel, x)) for x in range(1, 3)]),
-    )
+    @pytest.mark.slow
     def test_occurrence(self, event_labels, fixture_occurrence_constraint):
 
         fixture_occurrence_constraint.constrain(event_labels)
 
-    @pytest.mark.parametrize(
-        "event_labels",
-        reduce(add, [list(combinations(EventLabel, x)) for x in {0, 3}]),
-    )
+    @pytest.mark.slow
     def test_occurrence_invalid(self, event_labels, fixture_occurrence_constraint):
 
         with pytest.raises(EventSourcerConstraintError):
@@ -97,21 +176,23 @@ class TestSourcingConstraint:
 
     def test_dependency(self, fixture_dependency_constraint):
 
-        size_event = choice(tuple(self.SIZE_EVENTS))
+        rng = Random(COMBINATION_SAMPLE_SEED)
+        size_event = rng.choice(SIZE_EVENTS_ORDERED)
 
-        event_labels = list(self.NON_SIZE_EVENTS)
-        shuffle(event_labels)
+        event_labels = list(NON_SIZE_EVENTS_ORDERED)
+        rng.shuffle(event_labels)
         event_labels.insert(0, size_event)
 
         fixture_dependency_constraint.constrain(event_labels)
 
     def test_dependency_invalid(self, fixture_dependency_constraint):
 
-        size_event = choice(tuple(self.SIZE_EVENTS))
+        rng = Random(COMBINATION_SAMPLE_SEED)
+        size_event = rng.choice(SIZE_EVENTS_ORDERED)
 
-        event_labels = list(self.NON_SIZE_EVENTS)
-        shuffle(event_labels)
-        event_labels.insert(randint(1, len(event_labels)), size_event)
+        event_labels = list(NON_SIZE_EVENTS_ORDERED)
+        rng.shuffle(event_labels)
+        event_labels.insert(rng.randint(1, len(event_labels)), size_event)
 
         with pytest.raises(EventSourcerConstraintError):
             fixture_dependency_constraint.constrain(event_labels)
@@ -119,71 +200,75 @@ class TestSourcingConstraint:
     def test_dependency_intersect(self):
 
         with pytest.raises(EventSourcerConstraintError):
-            DependencyConstraint(self.SIZE_EVENTS, EventLabel)
+            DependencyConstraint(SIZE_EVENTS, EventLabel)
 
 
 class TestEventSourcer:
-    class EventSourcerUnitTest(EventSourcer[EventLabel, Dict]):
+    class EventSourcerUnitTest(_EventSourcerDict):
         pass
 
-    EVENTS = {
-        EventLabel.MORE_ICE: {"ice": "more ice"},
-        EventLabel.LESS_ICE: {"ice": "less ice"},
-        EventLabel.ICE_FREE: {"ice": "ice-free"},
-        EventLabel.FULL_SUGAR: {"sugar": "full sugar"},
-        EventLabel.HALF_SUGAR: {"sugar": "half sugar"},
-        EventLabel.SUGAR_FREE: {"sugar": "sugar-free"},
-        EventLabel.SHORT: {"size": "short"},
-        EventLabel.TALL: {"size": "tall"},
-        EventLabel.GRANDE: {"size": "grande"},
-    }
-
-    ORDERS = {
-        OrderLabel.RECOMMEND: (
-            EventLabel.LESS_ICE,
-            EventLabel.SUGAR_FREE,
-            EventLabel.TALL,
-        ),
-        OrderLabel.POPULAR: (
-            EventLabel.ICE_FREE,
-            EventLabel.HALF_SUGAR,
-            EventLabel.TALL,
-        ),
-    }
+    @pytest.fixture(scope="module", autouse=True)
+    def fixture_sourcer(self):
 
-    RESULTS = {
-        OrderLabel.RECOMMEND: {
-            "ice": "less ice",
-            "sugar": "sugar-free",
-            "size": "tall",
-        },
-        OrderLabel.POPULAR: {
-            "ice": "ice-free",
-            "sugar": "half sugar",
-            "size": "tall",
-        },
-    }
+        yield self.EventSourcerUnitTest(EVENTS, (), or_)
 
-    @pytest.fixture(scope="class", autouse=True)
-    def fixture_sourcer(self):
+    @pytest.fixture(scope="module", autouse=True)
+    def fixture_constrained_sourcer(self):
 
-        yield self.EventSourcerUnitTest(self.EVENTS, (), or_)
+        yield self.EventSourcerUnitTest(EVENTS, CONSTRAINTS, or_)
 
-    @pytest.mark.parametrize("key", [event for event in EventLabel])
+    @pytest.mark.parametrize("key", list(EventLabel))
     def test_getitem(self, key, fixture_sourcer):
 
-        assert fixture_sourcer[key] == self.EVENTS[key]
+        assert fixture_sourcer[key] == EVENTS[key]
 
     def test_len(self, fixture_sourcer):
 
-        assert len(fixture_sourcer) == len(self.EVENTS)
+        assert len(fixture_sourcer) == len(EVENTS)
 
     def test_iter(self, fixture_sourcer):
 
-        expected = {k: v for k, v in self.EVENTS.items()}
-        assert {k: v for k, v in fixture_sourcer} == expected
+        assert dict(fixture_sourcer) == EVENTS
 
-    @pytest.mark.parametrize("order", [order for order in OrderLabel])
+    @pytest.mark.parametrize("order", list(OrderLabel))
     def test_source(self, order, fixture_sourcer):
 
-        assert fixture_sourcer.source(self.ORDERS[order]) == self.RESULTS[order]
+        assert fixture_sourcer.source(ORDERS[order]) == RESULTS[order]
+
+    @pytest.mark.parametrize("order", list(OrderLabel))
+    def test_compile_order(self, order, fixture_sourcer):
+
+        fixture_sourcer.compile_order(ORDERS[order])
+
+        assert fixture_sourcer.source(ORDERS[order]) == RESULTS[order]
+
+    def test_compile_order_empty(self, fixture_sourcer):
+
+        with pytest.raises(EventSourcerConstraintError):
+            fixture_sourcer.compile_order(())
+
+    def test_validate(self, fixture_constrained_sourcer):
+
+        fixture_constrained_sourcer.validate(
+            (EventLabel.TALL, EventLabel.SUGAR_FREE, EventLabel.LESS_ICE)
+        )
+
+    def test_validate_invalid(self, fixture_constrained_sourcer):
+
+        with pytest.raises(EventSourcerConstraintError):
+            fixture_constrained_sourcer.validate(
+                (EventLabel.TALL, EventLabel.TALL, EventLabel.SUGAR_FREE)
+            )
+
+    def test_exhaustive(self, fixture_constrained_sourcer):
+
+        expected = {}
+        for size in (None, *SIZE_EVENTS_ORDERED):
+            for sugar in SUGAR_EVENTS:
+                for ice in ICE_EVENTS:
+                    order = tuple(
+                        label for label in (size, sugar, ice) if label is not None
+                    )
+                    expected[order] = reduce(or_, (EVENTS[label] for label in order))
+
+        assert dict(fixture_constrained_sourcer.exhaustive()) == expected